@@ -2,15 +2,12 @@ import sys
 from contextlib import contextmanager
 from io import StringIO
 
-import numpy as np
 import pandas as pd
 import datetime
 
 import streamlit as st
 from threading import current_thread
 import altair as alt
-import functools
-import base64
 
 from timeseries_generator import (
     Generator,
@@ -27,7 +24,8 @@ from timeseries_generator.external_factors import (
 
 sys.path.append("../..")
 
-np.random.seed(42)
+# seed of the random factors, so that they generate the same values in every session
+RANDOM_SEED = 42
 
 st.set_page_config(
     page_title="Awesome TS Generator", layout="wide", initial_sidebar_state="auto"
@@ -39,7 +37,7 @@ st.set_page_config(
 st.title("Awesome Time Series Syntheic Data Generator")
 
 
-@st.cache
+@st.cache_data(show_spinner=False)
 def get_country_gdppc_df():
     df = pd.read_csv(
         "./examples/streamlit/GDP_per_capita_countries.csv", encoding="utf-8-sig"
@@ -47,136 +45,228 @@ def get_country_gdppc_df():
     return df
 
 
-@st.cache()
+@st.cache_data(show_spinner=False)
 def get_country_list():
     df = get_country_gdppc_df()
     return df["Country Name"].unique()
 
 
-st.sidebar.subheader("Input a base amount")
-base_amount = st.sidebar.number_input("", value=1000, format="%d")
+@st.cache_data(show_spinner=False)
+def load_country_gdp_data(country_list: tuple):
+    return CountryGdpFactor(country_list=list(country_list)).load_data()
+
+
+@st.cache_data(show_spinner=False)
+def load_eu_industry_product_data(intensive_scale: int):
+    return EUIndustryProductFactor(intensive_scale=intensive_scale).load_data()
+
+
+class CachedCountryGdpFactor(CountryGdpFactor):
+    """
+    CountryGdpFactor that reuses the prepared GDP data across streamlit reruns
+    """
+
+    def load_data(self) -> pd.DataFrame:
+        return load_country_gdp_data(tuple(self.features["country"]))
+
+
+class CachedEUIndustryProductFactor(EUIndustryProductFactor):
+    """
+    EUIndustryProductFactor that reuses the prepared index data across streamlit reruns
+    """
+
+    def load_data(self) -> pd.DataFrame:
+        return load_eu_industry_product_data(self._intensive_sale)
 
-feature_dict = {}
 
-st.sidebar.subheader("Input features")
-country_factor_flag = st.sidebar.checkbox("Country")
-if country_factor_flag:
-    countries = st.sidebar.multiselect(
-        "Choose countries", list(get_country_list()), ["Netherlands", "Italy"]
+FACTOR_CLASSES = {
+    factor_class.__name__: factor_class
+    for factor_class in (
+        RandomFeatureFactor,
+        CachedCountryGdpFactor,
+        LinearTrend,
+        HolidayFactor,
+        WeekdayFactor,
+        CachedEUIndustryProductFactor,
+        WhiteNoise,
     )
-    feature_dict["country"] = countries
+}
+
+
+def freeze(value):
+    """
+    Turn (nested) lists and dicts of factor arguments into hashable tuples and frozensets
+    """
+    if isinstance(value, dict):
+        return frozenset((key, freeze(val)) for key, val in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(val) for val in value)
+    return value
+
 
-feature_flag = st.sidebar.checkbox("Add more feature(s)")
-if feature_flag:
-    feature_raw_str = st.sidebar.text_input(
-        "Input feature list (must separate by comma)", "product"
+def thaw(value):
+    """
+    Inverse of `freeze`
+    """
+    if isinstance(value, frozenset):
+        return {key: thaw(val) for key, val in value}
+    if isinstance(value, tuple):
+        return [thaw(val) for val in value]
+    return value
+
+
+@st.cache_data(show_spinner=False)
+def _generate(factor_spec_tuple, features_tuple, start, end, base):
+    factors = frozenset(
+        FACTOR_CLASSES[factor_class_name](**thaw(kwargs))
+        for factor_class_name, kwargs in factor_spec_tuple
     )
-    feature_list = feature_raw_str.split(",")
+    g: Generator = Generator(
+        factors=factors,
+        features={feat: list(values) for feat, values in features_tuple},
+        date_range=pd.date_range(start, end),
+        base_value=base,
+    )
+    return g.generate()
+
+
+st.sidebar.subheader("Input a base amount")
+base_amount = st.sidebar.number_input("", value=1000, format="%d")
+
+feature_dict = {}
 
-    for feat in feature_list:
-        default_val_l = [f"{feat}_{i}" for i in range(3)]
-        feat_val_l = st.sidebar.text_input(
-            f"Input values of feature [{feat}] (must separate by comma)",
-            ",".join(default_val_l),
+# the sidebar is a form, so that changing its widgets only reruns the app once "Generate" is pressed
+with st.sidebar.form("config"):
+    st.subheader("Input features")
+    country_factor_flag = st.checkbox("Country")
+    if country_factor_flag:
+        countries = st.multiselect(
+            "Choose countries", list(get_country_list()), ["Netherlands", "Italy"]
         )
-        feature_dict[feat] = feat_val_l.split(",")
+        feature_dict["country"] = countries
 
-factor_list = []
+    feature_flag = st.checkbox("Add more feature(s)")
+    if feature_flag:
+        feature_raw_str = st.text_input(
+            "Input feature list (must separate by comma)", "product"
+        )
+        feature_list = feature_raw_str.split(",")
 
+        for feat in feature_list:
+            default_val_l = [f"{feat}_{i}" for i in range(3)]
+            feat_val_l = st.text_input(
+                f"Input values of feature [{feat}] (must separate by comma)",
+                ",".join(default_val_l),
+            )
+            feature_dict[feat] = feat_val_l.split(",")
 
-# -------------------------
-# add feature related factors
+    factor_spec_list = []
 
-st.sidebar.subheader("Select factor for each feature")
+    # -------------------------
+    # add feature related factors
 
-feat_factor_dict = {
-    "random_factor": RandomFeatureFactor,
-    "country_factor": CountryGdpFactor,
-}
+    st.subheader("Select factor for each feature")
 
-factor_switch_dict = {}
-for feat in feature_dict.keys():
-    factor_switch = st.sidebar.checkbox(f"{feat}", key=f"factor_switch_{feat}")
-    if factor_switch:
-        feat_factor_options = st.sidebar.multiselect(
-            f"select factor for [{feat}]",
-            ("random_factor", "country_factor", "linear_factor"),
-        )
-        if len(feat_factor_options) > 0:
-            for factor in feat_factor_options:
-                if factor == "random_factor":
-                    factor_list.append(
-                        RandomFeatureFactor(
-                            feature=feat,
-                            feature_values=feature_dict[feat],
-                            col_name=f"random_feature_factor_{feat}",
-                        )
-                    )
-                if factor == "country_factor":
-                    if feat == "country":
-                        factor_list.append(
-                            CountryGdpFactor(country_list=feature_dict[feat])
-                        )
-                if factor == "linear_factor":
-                    feat_val_linear_trend_dict = {}
-                    for feat_val in feature_dict[feat]:
-                        coef = st.sidebar.number_input(
-                            f"Linear slope of {feat_val}",
-                            value=1.0,
-                            format="%f",
-                            key="linear_trend_{feat}_{feat_val}",
+    feat_factor_dict = {
+        "random_factor": RandomFeatureFactor,
+        "country_factor": CountryGdpFactor,
+    }
+
+    factor_switch_dict = {}
+    for feat in feature_dict.keys():
+        factor_switch = st.checkbox(f"{feat}", key=f"factor_switch_{feat}")
+        if factor_switch:
+            feat_factor_options = st.multiselect(
+                f"select factor for [{feat}]",
+                ("random_factor", "country_factor", "linear_factor"),
+            )
+            if len(feat_factor_options) > 0:
+                for factor in feat_factor_options:
+                    if factor == "random_factor":
+                        factor_spec_list.append(
+                            (
+                                "RandomFeatureFactor",
+                                dict(
+                                    feature=feat,
+                                    feature_values=feature_dict[feat],
+                                    col_name=f"random_feature_factor_{feat}",
+                                    seed=RANDOM_SEED,
+                                ),
+                            )
                         )
-                        feat_val_linear_trend_dict[feat_val] = {
-                            "coef": coef,
-                            "offset": 0,
-                        }
-                    factor_list.append(
-                        LinearTrend(
-                            feature=feat,
-                            feature_values=feat_val_linear_trend_dict,
-                            col_name=f"lin_trend_{feat}",
+                    if factor == "country_factor":
+                        if feat == "country":
+                            factor_spec_list.append(
+                                (
+                                    "CachedCountryGdpFactor",
+                                    dict(country_list=feature_dict[feat]),
+                                )
+                            )
+                    if factor == "linear_factor":
+                        feat_val_linear_trend_dict = {}
+                        for feat_val in feature_dict[feat]:
+                            coef = st.number_input(
+                                f"Linear slope of {feat_val}",
+                                value=1.0,
+                                format="%f",
+                                key=f"linear_trend_{feat}_{feat_val}",
+                            )
+                            feat_val_linear_trend_dict[feat_val] = {
+                                "coef": coef,
+                                "offset": 0,
+                            }
+                        factor_spec_list.append(
+                            (
+                                "LinearTrend",
+                                dict(
+                                    feature=feat,
+                                    feature_values=feat_val_linear_trend_dict,
+                                    col_name=f"lin_trend_{feat}",
+                                ),
+                            )
                         )
-                    )
 
+    # add global factors
 
-# add global factors
+    st.subheader("Add other factor")
 
-st.sidebar.subheader("Add other factor")
-
-if country_factor_flag:
-    is_holiday = st.sidebar.checkbox("Add holiday factor")
-    holiday_scale = st.sidebar.slider(
-        "Holiday factor scale", min_value=1, max_value=10, value=2, step=1
+    if country_factor_flag:
+        is_holiday = st.checkbox("Add holiday factor")
+        holiday_scale = st.slider(
+            "Holiday factor scale", min_value=1, max_value=10, value=2, step=1
+        )
+        if is_holiday:
+            if "country" in feature_dict:
+                holiday_factor = dict(
+                    country_list=feature_dict["country"], holiday_factor=holiday_scale
+                )
+            else:
+                holiday_factor = dict(
+                    country_list=["Netherlands"], holiday_factor=holiday_scale
+                )
+            factor_spec_list.append(("HolidayFactor", holiday_factor))
+
+    is_weekend = st.checkbox("Add weekend factor")
+    weekend_scale = st.slider(
+        "weekend factor scale", min_value=1, max_value=10, value=1, step=1
     )
-    if is_holiday:
-        if "country" in feature_dict:
-            holiday_factor = HolidayFactor(
-                country_list=feature_dict["country"], holiday_factor=holiday_scale
-            )
-        else:
-            holiday_factor = HolidayFactor(
-                country_list=["Netherlands"], holiday_factor=holiday_scale
-            )
-        factor_list.append(holiday_factor)
+    if is_weekend:
+        factor_spec_list.append(("WeekdayFactor", dict(intensity_scale=weekend_scale)))
 
+    is_eu_economics = st.checkbox("Add EU economics factor")
+    eu_eco_scale = st.slider(
+        "EU eco factor scale", min_value=1, max_value=20, value=5, step=1
+    )
+    if is_eu_economics:
+        factor_spec_list.append(
+            ("CachedEUIndustryProductFactor", dict(intensive_scale=eu_eco_scale))
+        )
 
-is_weekend = st.sidebar.checkbox("Add weekend factor")
-weekend_scale = st.sidebar.slider(
-    "weekend factor scale", min_value=1, max_value=10, value=1, step=1
-)
-if is_weekend:
-    factor_list.append(WeekdayFactor(intensity_scale=weekend_scale))
-
-is_eu_economics = st.sidebar.checkbox("Add EU economics factor")
-eu_eco_scale = st.sidebar.slider(
-    "EU eco factor scale", min_value=1, max_value=20, value=5, step=1
-)
-if is_eu_economics:
-    factor_list.append(EUIndustryProductFactor(intensive_scale=eu_eco_scale))
+    is_noise = st.checkbox("Add random noise")
+    if is_noise:
+        factor_spec_list.append(("WhiteNoise", dict(seed=RANDOM_SEED)))
 
-is_noise = st.sidebar.checkbox("Add random noise")
-if is_noise:
-    factor_list.append(WhiteNoise())
+    submitted = st.form_submit_button("Generate")
 
 
 # ---------------------------
@@ -193,14 +283,23 @@ with col2:
         "End date", datetime.date(2020, 12, 31), min_value=start_date
     )
 
-# generate time series
-g: Generator = Generator(
-    factors=set(factor_list),
-    features=feature_dict,
-    date_range=pd.date_range(start_date, end_date),
-    base_value=base_amount,
+# generate time series, only reruns the factors when their configuration changed
+factor_spec_tuple = tuple(
+    sorted(
+        (
+            (factor_class_name, freeze(kwargs))
+            for factor_class_name, kwargs in factor_spec_list
+        ),
+        key=lambda spec: spec[0],
+    )
 )
-df_sale = g.generate()
+features_tuple = tuple((feat, tuple(values)) for feat, values in feature_dict.items())
+generate_args = (factor_spec_tuple, features_tuple, start_date, end_date, base_amount)
+# the visualization widgets rerun the app as well, those reruns reuse the generated data
+if submitted or st.session_state.get("generate_args") != generate_args:
+    st.session_state["df_sale"] = _generate(*generate_args)
+    st.session_state["generate_args"] = generate_args
+df_sale = st.session_state["df_sale"]
 
 
 # ------------------------------------------------
@@ -215,36 +314,48 @@ vis_feat_l = st.multiselect("Choose features to aggregate", all_features, all_fe
 if len(vis_feat_l) > 0:
     group_feat_l = vis_feat_l.copy()
     group_feat_l.insert(0, "date")
-    df_vis = df_sale.groupby(group_feat_l)["value"].sum().reset_index()
+    # the feature columns are categorical, group on their codes and only on the feature combinations that occur
+    df_vis = (
+        df_sale.groupby(group_feat_l, observed=True, sort=False)["value"]
+        .sum()
+        .reset_index()
+    )
 else:
     df_vis = df_sale.copy()
 
 
-df_plot = df_vis[["date", "value"]]
+# collect the plotted columns first, so df_plot is built without copying a slice of df_vis
+plot_col_dict = {"date": df_vis["date"].values, "value": df_vis["value"].values}
 
 if len(vis_feat_l) > 0:
     color_col = "-".join(vis_feat_l)
-    df_plot[color_col] = functools.reduce(
-        lambda x, y: x + "-" + y, (df_vis[feat] for feat in vis_feat_l)
-    )
-
-    base = (
-        alt.Chart(df_plot)
-        .mark_line()
-        .encode(x="date:T", y="value:Q", color=f"{color_col}:N")
+    # concatenate the feature labels column-wise, instead of row by row
+    plot_col_dict[color_col] = (
+        df_vis[vis_feat_l[0]]
+        .astype(str)
+        .str.cat(df_vis[vis_feat_l[1:]].astype(str), sep="-")
+        .values
     )
+    df_plot = pd.DataFrame(plot_col_dict)
 
     selection = alt.selection_multi(fields=[color_col], bind="legend")
 
     chart = (
-        base.mark_line()
-        .encode(opacity=alt.condition(selection, alt.value(1), alt.value(0.2)))
+        alt.Chart(df_plot)
+        .mark_line()
+        .encode(
+            x="date:T",
+            y="value:Q",
+            color=f"{color_col}:N",
+            opacity=alt.condition(selection, alt.value(1), alt.value(0.2)),
+        )
         .add_selection(selection)
         .interactive()
     )
 
     st.altair_chart(chart, use_container_width=True)
 else:
+    df_plot = pd.DataFrame(plot_col_dict)
 
     base = (
         alt.Chart(df_plot)
@@ -261,20 +372,16 @@ else:
 
 # --------------
 # download dataframe
-def get_table_download_link(df):
-    """Generates a link allowing the data in a given panda dataframe to be downloaded
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    """Serializes the dataframe to csv, only once for every dataframe
     in:  dataframe
-    out: href string
+    out: csv bytes
     """
-    csv = df.to_csv(index=False)
-    b64 = base64.b64encode(
-        csv.encode()
-    ).decode()  # some strings <-> bytes conversions necessary here
-    href = f'<a href="data:file/csv;base64,{b64}">Download csv file</a>'
-    return href
+    return df.to_csv(index=False).encode()
 
 
-st.markdown(get_table_download_link(df_vis), unsafe_allow_html=True)
+st.download_button("Download csv file", to_csv_bytes(df_vis), "data.csv", "text/csv")
 
 
 # -------------
@@ -11,7 +11,10 @@ setup(
     packages=find_packages(),
     # TODO: Once we use apis to import public data, the `package_data` is no longer required.
     package_data={
-        "timeseries_generator": ["resources/public_data/*.csv"]
+        "timeseries_generator": [
+            "resources/public_data/*.csv",
+            "resources/public_data/*.parquet",
+        ]
     },
     version="0.1.0",
     url='https://github.com/Nike-Inc/ts-generator',
@@ -20,8 +23,13 @@ setup(
     install_requires=[
         "pandas>=1.2.0",
         "workalendar>=15.0.1",
-        "matplotlib>=3.3.3"
+        "matplotlib>=3.3.3",
+        "pyarrow>=3.0.0",
     ],
+    extras_require={
+        "numba": ["numba>=0.53.0"],
+        "numexpr": ["numexpr>=2.7.0"]
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent"
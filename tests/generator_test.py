@@ -2,9 +2,10 @@ import unittest
 from typing import List, Dict
 
 from pandas import date_range
+from pandas.testing import assert_frame_equal
 from pandas._libs.tslibs.timestamps import Timestamp
 
-from timeseries_generator import SinusoidalFactor, Generator
+from timeseries_generator import SinusoidalFactor, Generator, FactorAlreadyExistsError
 
 
 class TestGenerator(unittest.TestCase):
@@ -48,3 +49,74 @@ class TestGenerator(unittest.TestCase):
             base_value=1
         )
         self.assertEqual(len(self.features_dict), len(g.generate()["product"].unique()))
+
+    def testGeneratorForCustomDateColumn(self):
+        """
+        test whether factors with another date column name than "date" are applied
+        """
+        sf: SinusoidalFactor = SinusoidalFactor(
+            wavelength=365., amplitude=1., phase=365 / 4, mean=1., date_col_name="day"
+        )
+        g: Generator = Generator(
+            factors={sf},
+            features=self.features_dict,
+            date_range=date_range(start=self.start_date, end=self.end_date),
+            base_value=1
+        )
+        self.assertAlmostEqual(2., g.generate()[sf.col_name].values[0])
+
+    def testGeneratorReusesTimeSeries(self):
+        """
+        test whether the time series is only generated again after the generator changed
+        """
+        g: Generator = Generator(
+            factors={
+                self.product_seasonal_components
+            },
+            features=self.features_dict,
+            date_range=date_range(start=self.start_date, end=self.end_date),
+            base_value=1
+        )
+        df = g.generate()
+        ts = g.ts
+        assert_frame_equal(df, g.generate())
+        self.assertIs(ts, g.ts)
+        # the returned time series are copies of the reused one
+        df["value"] *= 2
+        assert_frame_equal(ts, g.generate())
+        df = g.generate()
+        g.base_value = 2
+        self.assertAlmostEqual(2 * df["value"].values[0], g.generate()["value"].values[0], places=5)
+
+    def testGeneratorFactorsByName(self):
+        """
+        test whether factors are added, updated and removed by their column name
+        """
+        g: Generator = Generator(
+            factors={
+                self.product_seasonal_components
+            },
+            features=self.features_dict,
+            date_range=date_range(start=self.start_date, end=self.end_date),
+            base_value=1
+        )
+        sf: SinusoidalFactor = SinusoidalFactor(
+            wavelength=365., amplitude=1., phase=0., mean=1., col_name="product_seasonal_trend_factor"
+        )
+        with self.assertRaises(FactorAlreadyExistsError):
+            g.add_factor(sf)
+        g.update_factor(sf)
+        self.assertEqual({sf}, g.factors)
+        with self.assertRaises(KeyError):
+            g.remove_factor(self.product_seasonal_components)  # replaced by sf, which has the same column name
+        with self.assertRaises(AttributeError):
+            g.factors.discard(sf)
+        g.remove_factor(sf)
+        self.assertEqual(set(), g.factors)
+
+    def testGeneratorDefaultDateRange(self):
+        """
+        test whether the time series covers 50 days when no date range is given
+        """
+        g: Generator = Generator(factors={self.product_seasonal_components}, features=self.features_dict)
+        self.assertEqual(50, g.generate()["date"].nunique())
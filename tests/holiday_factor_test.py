@@ -21,3 +21,21 @@ class TestHolidayFactor(unittest.TestCase):
         )
         df: DataFrame = holiday_factor.generate(start_date=self.start_date, end_date=self.end_date)
         self.assertAlmostEqual(2., df[holiday_factor.col_name].head(1).values[0])
+
+    def testGenerateWithHolidayOfNextYear(self):
+        # the holidays of Kenya in 2006 contain new year's day of 2007
+        holiday_factor = HolidayFactor(country_list=["Kenya"])
+        df: DataFrame = holiday_factor.generate(start_date="2006-03-01", end_date="2006-12-31")
+        self.assertEqual(305, len(df))
+
+    def testGenerateWithHolidayOfPreviousYear(self):
+        # new year's day of 2022 is on a saturday, the holidays of the United States in 2022 contain the observed
+        # holiday on 2021-12-31
+        holiday_factor = HolidayFactor(country_list=["UnitedStates"])
+        # without an end date, only the holidays of 2022 are used
+        df_2022: DataFrame = holiday_factor.generate(start_date="2022-12-01")
+        df_2023: DataFrame = holiday_factor.generate(start_date="2022-12-01", end_date="2023-01-01")
+        self.assertEqual(31, len(df_2022))
+        self.assertListEqual(
+            df_2023[holiday_factor.col_name].tolist(), df_2022[holiday_factor.col_name].tolist()
+        )
@@ -0,0 +1,44 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+from pandas import DatetimeIndex
+
+from timeseries_generator import _kernels
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(0)
+
+    def testSinusoid(self):
+        t = np.arange(1000, dtype=np.int64)
+        wavelength, amplitude, phase, mean = self.rng.uniform(1, 400, size=(4, 3))
+        expected = _kernels._sinusoid_numpy(t, wavelength, amplitude, phase, mean, np.empty((1000, 3)))
+        actual = _kernels.sinusoid(t, wavelength, amplitude, phase, mean, np.empty((1000, 3)))
+        assert_allclose(expected, actual, rtol=1e-9, atol=1e-9)
+
+    def testLinearTrend(self):
+        days = np.arange(1000, dtype=np.int64)
+        coef, offset = self.rng.uniform(-1, 1, size=(2, 3))
+        expected = _kernels._linear_trend_numpy(days, coef, offset, 999, np.empty((1000, 3)))
+        actual = _kernels.linear_trend(days, coef, offset, 999, np.empty((1000, 3)))
+        assert_allclose(expected, actual, rtol=1e-12)
+
+    def testWeekdayLookup(self):
+        # dates before and after the epoch, in steps of 7 hours
+        dates = np.arange(-1000, 1000, dtype=np.int64) * 7 * 3_600_000_000_000
+        weekday_values = np.arange(1, 8, dtype=np.float64)
+        expected = _kernels._weekday_lookup_numpy(dates, weekday_values, np.empty(len(dates)))
+        actual = _kernels.weekday_lookup(dates, weekday_values, np.empty(len(dates)))
+        assert_array_equal(expected, actual)
+        assert_array_equal(weekday_values[DatetimeIndex(dates).dayofweek], expected)
+
+    def testProduct(self):
+        arrays = [self.rng.uniform(0.5, 2, size=100).astype(np.float32) for _ in range(3)]
+        expected = arrays[0] * arrays[1] * arrays[2]
+        with mock.patch.object(_kernels, "numexpr", None):
+            assert_allclose(expected, _kernels.product(arrays, np.empty(100, dtype=np.float32)), rtol=1e-6)
+            assert_array_equal(np.ones(100), _kernels.product([], np.empty(100, dtype=np.float32)))
+        assert_allclose(expected, _kernels.product(arrays, np.empty(100, dtype=np.float32)), rtol=1e-6)
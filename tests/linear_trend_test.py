@@ -0,0 +1,29 @@
+import unittest
+
+from pandas import DataFrame
+from pandas._libs.tslibs.timestamps import Timestamp
+
+from timeseries_generator import LinearTrend
+
+
+class TestLinearTrend(unittest.TestCase):
+    def setUp(self) -> None:
+        self.start_date = Timestamp("01-01-2018")
+        self.end_date = Timestamp("01-10-2018")
+
+    def testGenerateOnAll(self):
+        lt: LinearTrend = LinearTrend(coef=1., offset=0.)
+        df: DataFrame = lt.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertAlmostEqual(1., df[lt.col_name].values[0])
+        self.assertAlmostEqual(1.9, df[lt.col_name].values[-1])
+
+    def testGenerateOnFeature(self):
+        lt: LinearTrend = LinearTrend(feature="my_feature", feature_values={
+            "foo": {"coef": 1., "offset": 0.},
+            "bar": {"coef": 2., "offset": 1.}
+        })
+        df: DataFrame = lt.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertEqual(20, len(df))
+        df_last: DataFrame = df[df["date"] == self.end_date].set_index("my_feature")
+        self.assertAlmostEqual(1.9, df_last.loc["foo", lt.col_name])
+        self.assertAlmostEqual(3.8, df_last.loc["bar", lt.col_name])
@@ -0,0 +1,30 @@
+import unittest
+
+from pandas import DataFrame
+from pandas._libs.tslibs.timestamps import Timestamp
+
+from timeseries_generator import RandomFeatureFactor
+
+
+class TestRandomFeatureFactor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.start_date = Timestamp("01-01-2018")
+        self.end_date = Timestamp("01-01-2020")
+
+    def testGenerate(self):
+        rff: RandomFeatureFactor = RandomFeatureFactor(
+            feature="store", feature_values=["store_1", "store_2"], min_factor_value=1, max_factor_value=10, seed=0
+        )
+        df: DataFrame = rff.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertTrue(df[rff.col_name].between(1, 10).all())
+        # a single factor per feature value, applied to all dates
+        self.assertEqual(2, len(df))
+
+    def testGenerateWithSeed(self):
+        df1: DataFrame = RandomFeatureFactor(
+            feature="store", feature_values=["store_1", "store_2"], seed=42
+        ).generate(start_date=self.start_date, end_date=self.end_date)
+        df2: DataFrame = RandomFeatureFactor(
+            feature="store", feature_values=["store_1", "store_2"], seed=42
+        ).generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertTrue(df1.equals(df2))
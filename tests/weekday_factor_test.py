@@ -0,0 +1,34 @@
+import unittest
+from collections import OrderedDict
+
+from pandas import DataFrame
+from pandas._libs.tslibs.timestamps import Timestamp
+
+from timeseries_generator import WeekdayFactor
+
+
+class TestWeekdayFactor(unittest.TestCase):
+    def setUp(self) -> None:
+        # a monday
+        self.start_date = Timestamp("01-06-2020")
+        self.end_date = Timestamp("01-20-2020")
+
+    def testGenerate(self):
+        wf: WeekdayFactor = WeekdayFactor(factor_values={0: 1.5, 6: 2.}, intensity_scale=2)
+        df: DataFrame = wf.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertEqual(14, len(df))
+        self.assertListEqual([3., 2., 2., 2., 2., 2., 4.], df[wf.col_name].head(7).tolist())
+
+    def testUpdateFactorValues(self):
+        wf: WeekdayFactor = WeekdayFactor(factor_values={0: 1.5})
+        wf.factor_values = {1: 3.}
+        wf.intensity_scale = 2
+        df: DataFrame = wf.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertListEqual([2., 6., 2., 2., 2., 2., 2.], df[wf.col_name].head(7).tolist())
+
+    def testFactorValuesDictSubclass(self):
+        wf: WeekdayFactor = WeekdayFactor(factor_values=OrderedDict({0: 1.5}))
+        df: DataFrame = wf.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertEqual(1.5, df[wf.col_name].iloc[0])
+        with self.assertRaises(ValueError):
+            WeekdayFactor(factor_values=[1.5])
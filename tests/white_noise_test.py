@@ -0,0 +1,52 @@
+import unittest
+
+from pandas import DataFrame
+from pandas._libs.tslibs.timestamps import Timestamp
+
+from timeseries_generator import WhiteNoise
+
+
+class TestWhiteNoise(unittest.TestCase):
+    def setUp(self) -> None:
+        self.start_date = Timestamp("01-01-2018")
+        self.end_date = Timestamp("01-01-2020")
+
+    def testGenerate(self):
+        wn: WhiteNoise = WhiteNoise(stdev_factor=0.05)
+        df: DataFrame = wn.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertAlmostEqual(1., df[wn.col_name].mean(), places=1)
+
+    def testGenerateOnFeature(self):
+        wn: WhiteNoise = WhiteNoise(stdev_factor=None, feature_values={
+            "my_feature": {
+                "foo": 0.01,
+                "bar": 0.5
+            }
+        })
+        df: DataFrame = wn.generate(start_date=self.start_date, end_date=self.end_date)
+        stdev = df.groupby("my_feature")[wn.col_name].std()
+        self.assertLess(stdev["foo"], stdev["bar"])
+
+    def testGenerateWithSeed(self):
+        df1: DataFrame = WhiteNoise(seed=42).generate(start_date=self.start_date, end_date=self.end_date)
+        df2: DataFrame = WhiteNoise(seed=42).generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertTrue(df1.equals(df2))
+
+    def testGenerateWithDtype(self):
+        df32: DataFrame = WhiteNoise().generate(start_date=self.start_date, end_date=self.end_date)
+        df64: DataFrame = WhiteNoise(dtype="float64").generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertEqual("float32", df32["white_noise"].dtype)
+        self.assertEqual("float64", df64["white_noise"].dtype)
+
+    def testGenerateOnFeatureColumns(self):
+        # regression test of the per feature standard deviations, which used to be looked up with a row-wise apply on a
+        # misspelled noise column
+        wn: WhiteNoise = WhiteNoise(stdev_factor=None, feature_values={
+            "my_feature": {
+                "foo": 0.,
+                "bar": 0.5
+            }
+        })
+        df: DataFrame = wn.generate(start_date=self.start_date, end_date=self.end_date)
+        self.assertListEqual(["date", "my_feature", wn.col_name], df.columns.tolist())
+        self.assertTrue((df.loc[df["my_feature"] == "foo", wn.col_name] == 1.).all())
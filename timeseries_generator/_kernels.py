@@ -0,0 +1,160 @@
+"""
+Numerical kernels used by the factors and the generator. The kernels are compiled with numba, or evaluated with
+numexpr, when these are installed, otherwise an equivalent NumPy implementation is used.
+
+The compiled kernels are cached on disk, so that a new process does not compile them again. They are not run in
+parallel: the loops are short or memory bound, and numba's thread pool keeps processes that call the kernels from a
+non-main thread, such as the streamlit app, from exiting.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency
+    njit = None
+
+try:
+    import numexpr
+except ImportError:  # numexpr is an optional dependency
+    numexpr = None
+
+NS_PER_DAY = 86_400_000_000_000
+
+
+def _sinusoid_numpy(
+    t: np.ndarray,
+    wavelength: np.ndarray,
+    amplitude: np.ndarray,
+    phase: np.ndarray,
+    mean: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluates `amplitude * sin(2 * pi * (t + phase) / wavelength) + mean` into a preallocated array, for a number of
+    sinusoids at once.
+
+    Args:
+        t: time in days.
+        wavelength: wavelength in days, per sinusoid.
+        amplitude: amplitude, per sinusoid.
+        phase: phase in days, per sinusoid.
+        mean: mean, per sinusoid.
+        out: array of shape `(len(t), number of sinusoids)`, to write the values to.
+
+    Returns:
+        `out`, containing a column of values per sinusoid.
+    """
+    out[:] = (
+        amplitude
+        * np.sin(2 * np.pi * np.add(t[:, None], phase, dtype=np.float64) / wavelength)
+        + mean
+    )
+    return out
+
+
+def _linear_trend_numpy(
+    days: np.ndarray,
+    coef: np.ndarray,
+    offset: np.ndarray,
+    n_days: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluates `coef / n_days * days + 1 + offset` into a preallocated array, for a number of linear trends at once.
+
+    Args:
+        days: time in days.
+        coef: total slope over `n_days`, per trend.
+        offset: offset, per trend.
+        n_days: number of days the slope is spread over.
+        out: array of shape `(len(days), number of trends)`, to write the values to.
+
+    Returns:
+        `out`, containing a column of values per trend.
+    """
+    out[:] = coef / n_days * days[:, None] + 1 + offset
+    return out
+
+
+def _weekday_lookup_numpy(
+    dates: np.ndarray, weekday_values: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """
+    Looks up a value per day of the week for a number of dates, into a preallocated array. The day of the week is
+    computed from the days since the epoch, 1970-01-01, which was a thursday.
+
+    Args:
+        dates: dates as nanoseconds since the epoch.
+        weekday_values: array with a value per day of the week, with monday=0 and sunday=6.
+        out: array with the same length as `dates`, to write the values to.
+
+    Returns:
+        `out`, containing the value of the day of the week of every date.
+    """
+    return weekday_values.take((dates // NS_PER_DAY + 3) % 7, out=out)
+
+
+if njit is None:
+    sinusoid = _sinusoid_numpy
+    linear_trend = _linear_trend_numpy
+    weekday_lookup = _weekday_lookup_numpy
+else:
+
+    @njit(fastmath=True, cache=True)
+    def sinusoid(t, wavelength, amplitude, phase, mean, out):
+        """
+        Compiled version of `_sinusoid_numpy`, evaluating the sinusoids in a single loop over the dates.
+        """
+        for i in range(len(t)):
+            for j in range(len(wavelength)):
+                out[i, j] = (
+                    amplitude[j] * np.sin(2 * np.pi * (t[i] + phase[j]) / wavelength[j])
+                    + mean[j]
+                )
+        return out
+
+    @njit(fastmath=True, cache=True)
+    def linear_trend(days, coef, offset, n_days, out):
+        """
+        Compiled version of `_linear_trend_numpy`, evaluating the trends in a single loop over the dates.
+        """
+        for i in range(len(days)):
+            for j in range(len(coef)):
+                out[i, j] = coef[j] / n_days * days[i] + 1 + offset[j]
+        return out
+
+    @njit(cache=True)
+    def weekday_lookup(dates, weekday_values, out):
+        """
+        Compiled version of `_weekday_lookup_numpy`, computing the day of the week and looking up its value in a single
+        loop over the dates, without intermediate arrays.
+        """
+        for i in range(len(dates)):
+            out[i] = weekday_values[(dates[i] // NS_PER_DAY + 3) % 7]
+        return out
+
+
+def product(arrays: Sequence[np.ndarray], out: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the elementwise product of a number of arrays into a preallocated array. With numexpr the product is
+    evaluated in a single multithreaded pass, otherwise the arrays are multiplied into `out` one by one. Neither
+    stacks the arrays into a 2D copy.
+
+    Args:
+        arrays: arrays with the same length as `out`.
+        out: array to write the product to. Contains ones when `arrays` is empty.
+
+    Returns:
+        `out`, containing the product.
+    """
+    if numexpr is not None and len(arrays) > 0:
+        local_dict = {f"a{i}": array for i, array in enumerate(arrays)}
+        return numexpr.evaluate("*".join(local_dict), local_dict=local_dict, out=out)
+
+    out[:] = 1
+    for array in arrays:
+        np.multiply(out, array, out=out)
+    return out
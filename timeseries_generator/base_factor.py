@@ -1,14 +1,45 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Union, Tuple
+from datetime import tzinfo
+from functools import lru_cache
+from typing import List, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
-from matplotlib.figure import Figure
-from matplotlib.axes._subplots import SubplotBase
-from matplotlib.pyplot import subplots
 from pandas import DataFrame, date_range, DatetimeIndex
 from pandas._libs.tslibs.timestamps import Timestamp
 
+from timeseries_generator.utils import get_cartesian_product
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes._subplots import SubplotBase
+
+
+@lru_cache(maxsize=64)
+def _cached_date_range(
+    start_ns: int,
+    start_tz: Optional[tzinfo],
+    end_ns: Optional[int],
+    end_tz: Optional[tzinfo],
+    periods: Optional[int],
+) -> DatetimeIndex:
+    """
+    Cached `date_range`, keyed on nanosecond epoch values so that repeated requests for the same dates (e.g. from every
+    factor in a `Generator`) share a single DatetimeIndex.
+
+    The returned index is shared by all callers, so its values must never be modified. DataFrames built from it without
+    copying (e.g. with `copy=False`) copy the dates first, as writing to such a DataFrame would modify the cached index.
+    """
+    return date_range(
+        start=Timestamp(start_ns, tz=start_tz),
+        end=None if end_ns is None else Timestamp(end_ns, tz=end_tz),
+        periods=periods,
+    )
+
 
 class BaseFactor(ABC):
+    # whether the factor values do not change over time. The DataFrames generated by time invariant factors have no
+    # date column, the factor values are applied to all dates.
+    time_invariant: bool = False
+
     def __init__(
         self,
         col_name: str,
@@ -81,14 +112,15 @@ class BaseFactor(ABC):
         Returns:
             :obj:`DateTimeIndex` compatable with this module.
         """
-        periods: Optional[int] = None
         if not isinstance(start_date, Timestamp):
             start_date = Timestamp(start_date)
-        if end_date and not isinstance(end_date, Timestamp):
+        if end_date is None:
+            return _cached_date_range(start_date.value, start_date.tz, None, None, 50)
+        if not isinstance(end_date, Timestamp):
             end_date = Timestamp(end_date)
-        elif end_date is None:
-            periods = 50
-        return date_range(start=start_date, end=end_date, periods=periods)
+        return _cached_date_range(
+            start_date.value, start_date.tz, end_date.value, end_date.tz, None
+        )
 
     @abstractmethod
     def generate(
@@ -111,7 +143,7 @@ class BaseFactor(ABC):
         self,
         start_date: Union[Timestamp, str, int, float],
         end_date: Optional[Union[Timestamp, str, int, float]] = None,
-    ) -> Tuple[Figure, SubplotBase]:
+    ) -> Tuple["Figure", "SubplotBase"]:
         """
         Plots the factor on a 2D line plot. Convenience method to show what the factor looks like.
         Args:
@@ -121,11 +153,28 @@ class BaseFactor(ABC):
         Returns:
             a tuple containing the figure and axes handle
         """
+        # matplotlib is only imported when plotting, as importing pyplot is slow
+        from matplotlib.pyplot import subplots
+
         df: DataFrame = self.generate(start_date=start_date, end_date=end_date)
+        if self.time_invariant:
+            df = get_cartesian_product(
+                self.get_datetime_index(
+                    start_date=start_date, end_date=end_date
+                ).to_frame(index=False, name=self.date_col_name),
+                df,
+            )
         fig, ax = subplots()
         if self._features:
-            for label, grp in df.groupby(list(self.features.keys())):
-                grp.plot(x=self.date_col_name, y=self.col_name, ax=ax, label=label)
+            # a column per combination of feature labels, so all lines are drawn with a single call
+            wide_df: DataFrame = df.pivot_table(
+                index=self.date_col_name,
+                columns=list(self.features.keys()),
+                values=self.col_name,
+            )
+            ax.plot(wide_df.index.values, wide_df.values)
+            ax.legend(wide_df.columns.tolist())
+            ax.set_xlabel(self.date_col_name)
         else:
             df.plot(x=self.date_col_name, y=self.col_name, ax=ax)
 
@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Hashable, Union, Dict, FrozenSet
 
-from pandas import DataFrame, to_datetime, read_csv
+from numpy import float32, int32, nan, ndarray, searchsorted, tile, where
+from pandas import DataFrame, DatetimeIndex, to_datetime, read_parquet
 from pandas._libs.tslibs.timestamps import Timestamp
 
 from timeseries_generator.external_factors.external_factor import ExternalFactor
@@ -51,17 +52,30 @@ class CountryGdpFactor(ExternalFactor):
             min_date=MIN_DATE,
             max_date=MAX_DATE,
         )
+        self._country_key: str = country_feature_name
+        self._country_set: FrozenSet[str] = frozenset(country_list)
+
+    @ExternalFactor.features.setter
+    def features(self, keys: Dict[str, List[str]]):
+        self._features = keys
+        self._country_key = iter(keys).__next__()
+        self._country_set = frozenset(keys[self._country_key])
+
+    def _data_key(self) -> Hashable:
+        # the loaded data only contains the selected countries
+        return super()._data_key() + (tuple(sorted(self._country_set)),)
 
     def load_data(self) -> DataFrame:
         """
-        Load GDPPC data, and prepare for 10 year history
+        Load the yearly GDPPC data of the selected countries. Every row contains the GDPPC of a country, dated at the
+        first day of the year.
         """
-        df = read_csv(
+        df = read_parquet(
             Path(__file__).parent.parent
             / "resources"
             / "public_data"
-            / "GDP_per_capita_countries.csv",
-            encoding="utf-8-sig",
+            / "GDP_per_capita_countries.parquet",
+            engine="pyarrow",
         )
 
         # use GDP per capita of NL in 2015 as the base amount to normalize GDPPC data
@@ -70,22 +84,59 @@ class CountryGdpFactor(ExternalFactor):
         ]
 
         # pick up the countries
-        df = df[df["Country Name"].isin(self.features[iter(self.features).__next__()])]
+        df = df[df["Country Name"].isin(self._country_set)]
         df = df.set_index("Country Name")
 
-        # transpose the dataframe, so that each row is a year. Remove headers
-        df = df.T[3:]
+        # transpose the year columns, so that each row is a year. The code and indicator headers are left out
+        df = df.iloc[:, 3:].T
 
         # set year as datetime type
-        df.index = to_datetime(df.index, format="%Y")
-
-        # get daily sample and forward fill
-        df = df.resample("D").ffill()
+        df.index = to_datetime(df.index, format="%Y", cache=True)
 
         df = df.stack().reset_index()
         df.columns = [self._date_col_name, "country", self._col_name]
 
         # normalize the country GDPPC by NL 2015 GDP
-        df[self._col_name] = df[self._col_name] / base_gdppc_amount
+        df[self._col_name] = (df[self._col_name] / base_gdppc_amount).astype(float32)
 
         return df
+
+    def generate(
+        self,
+        start_date: Union[Timestamp, str, int, float],
+        end_date: Optional[Union[Timestamp, str, int, float]] = None,
+    ) -> DataFrame:
+        data: DataFrame = self.data
+
+        # the daily dates are shared with the other factors through the date range cache
+        dates: DatetimeIndex = self.get_datetime_index(
+            start_date=Timestamp(start_date).ceil("D"),
+            end_date=self._max_date if end_date is None else end_date,
+        )
+        if end_date is not None:
+            dates = dates[: dates.searchsorted(Timestamp(end_date))]
+
+        # a row of GDPPC factors per year, with a column per country
+        yearly_df: DataFrame = data.pivot(
+            index=self._date_col_name, columns="country", values=self._col_name
+        )
+        years: ndarray = yearly_df.index.year.values.astype(int32)
+        yearly_values: ndarray = yearly_df.values.astype(float32)
+        countries: ndarray = yearly_df.columns.values
+
+        # look up the row of the year of every day, instead of keeping a forward filled daily copy of all years
+        day_years: ndarray = dates.year.values.astype(int32)
+        row_idx: ndarray = (searchsorted(years, day_years, side="right") - 1).clip(0)
+        # years without GDPPC are left out, instead of taking the GDPPC of an earlier year
+        daily_values: ndarray = where(
+            (years[row_idx] == day_years)[:, None], yearly_values[row_idx], nan
+        )
+
+        df = DataFrame(
+            {
+                self._date_col_name: dates.repeat(len(countries)),
+                "country": tile(countries, len(dates)),
+                self._col_name: daily_values.ravel(),
+            }
+        )
+        return df.dropna(subset=[self._col_name]).reset_index(drop=True)
@@ -1,6 +1,8 @@
 from pathlib import Path
+from typing import Hashable
 
-from pandas import read_csv, to_datetime, DataFrame
+from numpy import float32
+from pandas import read_parquet, to_datetime, DataFrame
 from pandas._libs.tslibs.timestamps import Timestamp
 
 from timeseries_generator.external_factors.external_factor import ExternalFactor
@@ -31,16 +33,20 @@ class EUIndustryProductFactor(ExternalFactor):
         super().__init__(col_name=col_name, min_date=MIN_DATE, max_date=MAX_DATE)
         self._intensive_sale = intensive_scale
 
+    def _data_key(self) -> Hashable:
+        return super()._data_key() + (self._intensive_sale,)
+
     def load_data(self) -> DataFrame:
-        df = read_csv(
+        df = read_parquet(
             Path(__file__).parent.parent
             / "resources"
             / "public_data"
-            / "eu_prod_index.csv",
-            names=[self._date_col_name, "value", "is_estimated"],
+            / "eu_prod_index.parquet",
+            engine="pyarrow",
         )
+        df = df.rename(columns={"date": self._date_col_name})
 
-        df[self._date_col_name] = to_datetime(df[self._date_col_name], format="%Y-%m")
+        df[self._date_col_name] = to_datetime(df[self._date_col_name])
         df = df.set_index(self._date_col_name)
 
         # get daily sample and forward fill
@@ -52,6 +58,8 @@ class EUIndustryProductFactor(ExternalFactor):
         df.columns = [self._date_col_name, self._col_name]
 
         # normalize the industry product index
-        df[self._col_name] = df[self._col_name] / 100 * self._intensive_sale
+        df[self._col_name] = (df[self._col_name] / 100 * self._intensive_sale).astype(
+            float32
+        )
 
         return df
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List, Union
+from typing import Optional, Dict, List, Union, Hashable
 
+from numpy import searchsorted
 from pandas import DataFrame
 from pandas._libs.tslibs.timestamps import Timestamp
 
@@ -25,6 +26,8 @@ class ExternalFactor(BaseFactor, ABC):
         )
         self._min_date = min_date
         self._max_date = max_date
+        self._cached_data: Optional[DataFrame] = None
+        self._cached_data_key: Optional[Hashable] = None
 
     @property
     def min_date(self) -> Optional[Union[Timestamp, str, int, float]]:
@@ -42,8 +45,29 @@ class ExternalFactor(BaseFactor, ABC):
     def max_date(self, date: Optional[Union[Timestamp, str, int, float]]):
         self._max_date = date
 
+    @property
+    def data(self) -> DataFrame:
+        """
+        The output of `load_data`, which is only loaded again when the data key of the factor changes.
+        """
+        data_key: Hashable = self._data_key()
+        if self._cached_data is None or data_key != self._cached_data_key:
+            self._cached_data = self.load_data()
+            self._cached_data_key = data_key
+        return self._cached_data
+
+    def _data_key(self) -> Hashable:
+        """
+        Key of the factor settings that the output of `load_data` depends on. Extend this when a factor's `load_data`
+        depends on other settings.
+        """
+        return self._col_name, self._date_col_name
+
     @abstractmethod
     def load_data(self) -> DataFrame:
+        """
+        Loads the external data. The date column of the returned DataFrame has to be sorted in ascending order.
+        """
         ...
 
     def generate(
@@ -51,9 +75,13 @@ class ExternalFactor(BaseFactor, ABC):
         start_date: Union[Timestamp, str, int, float],
         end_date: Optional[Union[Timestamp, str, int, float]] = None,
     ) -> DataFrame:
-        data: DataFrame = self.load_data()
+        data: DataFrame = self.data
+
+        # the dates are sorted, so the selection is a contiguous slice of the data
+        dates = data[self._date_col_name].values
+        start_idx = searchsorted(dates, Timestamp(start_date).to_datetime64())
         if end_date is None:
-            df_sel = data[(data["date"] >= start_date)]
+            end_idx = len(dates)
         else:
-            df_sel = data[(data["date"] >= start_date) & (data["date"] < end_date)]
-        return df_sel
+            end_idx = searchsorted(dates, Timestamp(end_date).to_datetime64())
+        return data.iloc[start_idx:end_idx].copy()
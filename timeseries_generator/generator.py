@@ -1,8 +1,9 @@
-from itertools import product
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, FrozenSet, Optional, Union, Iterable
 
+import numpy as np
 import pandas as pd
 
+from timeseries_generator._kernels import product
 from timeseries_generator.base_factor import BaseFactor
 from timeseries_generator.errors import FactorAlreadyExistsError, DuplicateNameError
 
@@ -24,24 +25,32 @@ class Generator:
             date_range: daterange of the resulting dataframe.
             base_value: base value of the resulting value of the time series. Mainly useful to give a correct order of
                 magnitude to your resulting data.
+
+        Raises:
+            DuplicateNameError: when factors have overlapping names.
         """
         if features is None:
             features = {}
         if date_range is None:
-            pd.date_range(pd.datetime(1970, 1, 1), periods=50),
-        self._factors = factors
+            date_range = pd.date_range("1970-01-01", periods=50)
+        # factors by their column name, in the order in which they were added
+        self._factors: Dict[str, BaseFactor] = self._index_factors(factors)
         self._features = features
         self._base_value = base_value
         self._date_range = date_range
         self._ts = None
+        # whether the generator changed since `ts` was generated
+        self._dirty = True
 
     @property
-    def factors(self):
-        return self._factors
+    def factors(self) -> FrozenSet[BaseFactor]:
+        # read-only, factors are added and removed with the methods of the generator
+        return frozenset(self._factors.values())
 
     @factors.setter
     def factors(self, factors: Set[BaseFactor]):
-        self._factors = factors
+        self._factors = self._index_factors(factors)
+        self._dirty = True
 
     @property
     def features(self):
@@ -50,6 +59,7 @@ class Generator:
     @features.setter
     def features(self, features: Dict[str, List[str]]):
         self._features = features
+        self._dirty = True
 
     @property
     def base_value(self):
@@ -58,6 +68,7 @@ class Generator:
     @base_value.setter
     def base_value(self, value: float):
         self._base_value = value
+        self._dirty = True
 
     @property
     def ts(self):
@@ -67,57 +78,151 @@ class Generator:
     def ts(self, ts: pd.DataFrame):
         self._ts = ts
 
-    def generate(self) -> pd.DataFrame:
+    def generate(self, refresh: bool = False) -> pd.DataFrame:
         """
         generates synthetic time series data based on the input factors. Uses the generate method in the factors to
         obtain mergeable dataframes.
 
+        The generated time series is reused until the factors, features or base value of the generator are changed.
+        Changes made to the factors themselves are not tracked. A copy of the time series is returned, so changing it
+        does not change the reused time series.
+
+        Args:
+            refresh: generate the time series again, also when the generator did not change. E.g. to draw new random
+                noise, or after changing a factor.
+
         Returns:
             DataFrame containing the feature labels and values.
-
-        Raises:
-            DuplicateNameError: when factors have overlapping names.
         """
-        # generate a combination of date and features data
-        ts: pd.DataFrame = pd.DataFrame(
-            product(list(self._date_range), *self._features.values()),
-            columns=["date"] + list(self._features.keys()),
-        )
+        if self._ts is not None and not (self._dirty or refresh):
+            return self._ts.copy()
+
+        # generate a combination of date and features data, in the order of `itertools.product`: a block of rows per
+        # date, with the values of the last feature cycling fastest
+        names: List[str] = ["date"] + list(self._features.keys())
+        axes: List[pd.Index] = [pd.Index(self._date_range)] + [
+            pd.Index(values) for values in self._features.values()
+        ]
+        sizes: List[int] = [len(axis) for axis in axes]
+        columns: Dict[str, Union[pd.Index, pd.Categorical]] = {}
+        # the key columns are factorized once, the factors are gathered on these codes
+        key_codes: Dict[str, np.ndarray] = {}
+        key_uniques: Dict[str, pd.Index] = {}
+        for i, (name, axis) in enumerate(zip(names, axes)):
+            # every value is repeated for the combinations of the following axes, tiled for those of the preceding
+            positions: np.ndarray = np.tile(
+                np.repeat(np.arange(sizes[i]), np.prod(sizes[i + 1 :], dtype=int)),
+                np.prod(sizes[:i], dtype=int),
+            )
+            axis_codes, key_uniques[name] = pd.factorize(axis)
+            key_codes[name] = axis_codes[positions]
+            if i == 0:
+                columns[name] = axis.take(positions)
+            else:
+                # store the feature labels as categorical codes instead of repeated strings
+                columns[name] = pd.Categorical.from_codes(
+                    key_codes[name], categories=key_uniques[name]
+                )
+        ts: pd.DataFrame = pd.DataFrame(columns)
 
         # Add base amount
-        ts["base_amount"] = self._base_value
+        ts["base_amount"] = np.float32(self._base_value)
 
-        # Merge the factors on the base_df
-        for f in self._factors:
+        # Look up the factor values of every row of the base_df
+        for f in self._factors.values():
             if f.apply_to_all:
                 f.features = self._features  # apply all features to the factor
             df: pd.DataFrame = f.generate(
                 start_date=self._date_range[0], end_date=self._date_range[-1]
             )
-            if f.date_col_name != "date":
-                df.rename(
-                    columns={f.date_col_name: "date"}
-                )  # rename date column to standard "date" name
-
-            ts = ts.merge(
-                df,
-                how="left",
-                on=list(f.features.keys()) + ["date"],  # Add date to merge columns
-            ).fillna(
-                1
-            )  # Factor 1 means no effect
-
-        factor_names = list(map(lambda factor: factor.col_name, self._factors))
-        if len(factor_names) != len(set(factor_names)):
-            raise DuplicateNameError(
-                f'duplicate factor names in factor names: "{factor_names}"'
+            keys: List[str] = list(f.features.keys())
+            if not f.time_invariant:
+                if f.date_col_name != "date":
+                    df = df.rename(
+                        columns={f.date_col_name: "date"}
+                    )  # rename date column to standard "date" name
+                keys.append("date")  # Add date to the key columns
+
+            ts[f.col_name] = self._gather_factor(
+                df, f.col_name, keys, key_codes, key_uniques
             )
+            # release the DataFrame of the factor before the next factor is generated
+            del df
 
-        ts["total_factor"] = ts[factor_names].prod(axis=1)
-        ts["value"] = ts["total_factor"] * ts["base_amount"]
+        factor_names = [f.col_name for f in self._factors.values()]
+        # the product of the factors, evaluated over the factor columns directly. All missing factors were filled with 1
+        total_factor: np.ndarray = product(
+            [ts[name].to_numpy() for name in factor_names],
+            np.empty(len(ts), dtype=np.float32),
+        )
+        ts["total_factor"] = total_factor
+        ts["value"] = total_factor * np.float32(self._base_value)
         self._ts = ts
+        self._dirty = False
+
+        return ts.copy()
+
+    @staticmethod
+    def _index_factors(factors: Iterable[BaseFactor]) -> Dict[str, BaseFactor]:
+        """
+        Index factors by their column name.
+
+        Args:
+            factors: factors to index.
+
+        Returns:
+            dictionary with the column names as keys and the factors as values.
+
+        Raises:
+            DuplicateNameError: when factors have overlapping names.
+        """
+        indexed_factors: Dict[str, BaseFactor] = {}
+        for factor in factors:
+            if factor.col_name in indexed_factors:
+                raise DuplicateNameError(
+                    factor.col_name,
+                    f'duplicate factor names in factor names: "{factor.col_name}"',
+                )
+            indexed_factors[factor.col_name] = factor
+        return indexed_factors
+
+    @staticmethod
+    def _gather_factor(
+        df: pd.DataFrame,
+        col_name: str,
+        keys: List[str],
+        key_codes: Dict[str, np.ndarray],
+        key_uniques: Dict[str, pd.Index],
+    ) -> np.ndarray:
+        """
+        Looks up the factor value of every row of the time series, by the codes of its key columns.
 
-        return ts
+        Args:
+            df: DataFrame generated by the factor.
+            col_name: column name of the factor.
+            keys: columns the factor values depend on.
+            key_codes: codes of the key columns of the time series.
+            key_uniques: values of the key columns, as indexed by their codes.
+
+        Returns:
+            float32 factor values in the row order of the time series. Rows without a factor value get factor 1.
+        """
+        key_sizes: List[int] = [len(key_uniques[key]) for key in keys]
+        df_codes: List[np.ndarray] = [
+            key_uniques[key].get_indexer(df[key]) for key in keys
+        ]
+        # factor values of key values that are not in the time series are left out
+        found: np.ndarray = np.logical_and.reduce([codes >= 0 for codes in df_codes])
+
+        values: np.ndarray = df[col_name].to_numpy()
+        # a factor value per combination of key values, factor 1 means no effect
+        lookup: np.ndarray = np.ones(int(np.prod(key_sizes)), dtype=np.float32)
+        lookup[
+            np.ravel_multi_index([codes[found] for codes in df_codes], key_sizes)
+        ] = values[found]
+        lookup[np.isnan(lookup)] = 1
+
+        return lookup[np.ravel_multi_index([key_codes[key] for key in keys], key_sizes)]
 
     def plot(self):
         """
@@ -135,12 +240,14 @@ class Generator:
         Raises:
              FactorAlreadyExistsError: when the factor already exists in the generator.
         """
-        if factor.col_name in map(lambda f: f.col_name, self._factors):
+        if factor.col_name in self._factors:
             raise FactorAlreadyExistsError(
+                factor.col_name,
                 f'factor "{factor}" already exists in generator '
-                f"{self.__class__.__name__}."
+                f"{self.__class__.__name__}.",
             )
-        self._factors.add(factor)
+        self._factors[factor.col_name] = factor
+        self._dirty = True
 
     def update_factor(self, factor: BaseFactor):
         """
@@ -149,19 +256,20 @@ class Generator:
         Args:
             factor: factor to add to the generator, or factor to update the definition of.
         """
-        factors: Set[BaseFactor] = self._factors
-        if factor.col_name in map(lambda f: f.col_name, self._factors):
-            factors = set(
-                filter(lambda f: f.col_name != factor.col_name, self._factors)
-            )
-        factors.add(factor)
-        self._factors = factors
-        return factors
+        self._factors[factor.col_name] = factor
+        self._dirty = True
+        return self.factors
 
     def remove_factor(self, factor: BaseFactor):
         """
         remove factor from time series.
         Args:
             factor: factor to remove from the generator.
+
+        Raises:
+            KeyError: when the factor is not in the generator.
         """
-        self._factors.remove(factor)
+        if self._factors.get(factor.col_name) is not factor:
+            raise KeyError(factor)
+        del self._factors[factor.col_name]
+        self._dirty = True
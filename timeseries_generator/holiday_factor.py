@@ -1,13 +1,33 @@
-import pkgutil
-from datetime import date, datetime
-from typing import Optional, List, Dict, Tuple, Union
-
-import workalendar
-from pandas import DataFrame, Series, date_range, concat, isnull
+from datetime import date
+from functools import lru_cache
+from importlib import import_module
+from typing import Optional, List, Dict, Tuple, Union, TYPE_CHECKING
+
+from numpy import (
+    arange,
+    array,
+    bool_,
+    concatenate,
+    convolve,
+    datetime64,
+    empty,
+    exp,
+    int32,
+    ndarray,
+    ones,
+    repeat,
+    tile,
+    where,
+    zeros,
+)
+from pandas import DataFrame, DatetimeIndex, Series
 from pandas._libs.tslibs.timestamps import Timestamp
 
 from timeseries_generator.external_factors.external_factor import BaseFactor
 
+if TYPE_CHECKING:
+    from workalendar.core import Calendar
+
 WORKALENDAR_CONTINENTS = ["africa", "america", "asia", "europe", "oceania", "usa"]
 
 
@@ -20,7 +40,6 @@ class HolidayFactor(BaseFactor):
         country_feature_name: Optional[str] = None,
         country_list: Optional[List[str]] = None,
     ):
-
         """
         This component uses public holiday information to generate factor
 
@@ -55,6 +74,11 @@ class HolidayFactor(BaseFactor):
 
         self._holiday_factor = holiday_factor
         self._special_holiday_factors = special_holiday_factors
+        # holidays as days since epoch and their names per country and year, so workalendar is only queried once per
+        # year
+        self._holiday_days: Dict[str, Dict[int, Tuple[ndarray, List[str]]]] = {}
+        # smoothed daily factors per country, span of years and holiday factor settings
+        self._smoothed_factors: Dict[Tuple, ndarray] = {}
 
         super().__init__(
             features={country_feature_name: country_list}, col_name=col_name
@@ -76,128 +100,195 @@ class HolidayFactor(BaseFactor):
     def special_holiday_factors(self, factors: Dict[str, float]):
         self._special_holiday_factors = factors
 
+    def _get_holiday_days(
+        self, country_name: str, first_year: int, last_year: int
+    ) -> Tuple[ndarray, List[str]]:
+        """
+        Get the holidays of a country from the first day of `first_year` up to and including `last_year`.
+
+        Args:
+            country_name: name of the country, as its workalendar class.
+            first_year: first year to get the holidays of.
+            last_year: last year to get the holidays of.
+
+        Returns:
+            a tuple containing the holidays as day offsets from the first day of `first_year` and the holiday names.
+        """
+        holiday_days = self._holiday_days.setdefault(country_name, {})
+        offsets: List[ndarray] = []
+        names: List[str] = []
+        for year in range(first_year, last_year + 1):
+            if year not in holiday_days:
+                holiday_days[year] = _get_year_holidays(
+                    _get_calendar(country_name), year
+                )
+            offsets.append(holiday_days[year][0])
+            names.extend(holiday_days[year][1])
+        # the holidays are stored as days since epoch, shift them to the first day of `first_year`
+        return concatenate(offsets) - _epoch_day(date(first_year, 1, 1)), names
+
+    def _get_smoothed_factors(
+        self, country_name: str, first_year: int, last_year: int
+    ) -> ndarray:
+        """
+        Get the smoothed daily holiday factors of a country from the first day of `first_year` up to and including the
+        last day of `last_year`. The factors are cached per span of years and holiday factor settings, so generating
+        other date windows within the same years only slices them.
+
+        Args:
+            country_name: name of the country, as its workalendar class.
+            first_year: first year to get the factors of.
+            last_year: last year to get the factors of.
+
+        Returns:
+            array containing a factor per day.
+        """
+        key: Tuple = (
+            country_name,
+            first_year,
+            last_year,
+            self._holiday_factor,
+            tuple(sorted(self._special_holiday_factors.items())),
+        )
+        if key not in self._smoothed_factors:
+            holiday_offsets, holiday_names = self._get_holiday_days(
+                country_name, first_year, last_year
+            )
+            n_days: int = (date(last_year, 12, 31) - date(first_year, 1, 1)).days + 1
+
+            # mark the holidays, and write the factors of the special holidays over them in a single assignment
+            is_holiday: ndarray = zeros(n_days, dtype=bool_)
+            is_holiday[holiday_offsets] = True
+            factors: ndarray = where(is_holiday, self._holiday_factor, 1.0)
+            if self._special_holiday_factors:
+                factors[holiday_offsets] = (
+                    Series(holiday_names, dtype=object)
+                    .map(self._special_holiday_factors)
+                    .fillna(self._holiday_factor)
+                    .values
+                )
+
+            # Apply smoothing to the curve using a gaussian moving window
+            self._smoothed_factors[key] = _gaussian_rolling_mean(
+                factors, window=10, std=2.0
+            )
+        return self._smoothed_factors[key]
+
     def generate(
         self,
         start_date: Union[Timestamp, str, int, float],
         end_date: Optional[Union[Timestamp, str, int, float]] = None,
     ) -> DataFrame:
-        def clean_holiday_tuples(input_tuples: Tuple[datetime, str]):
-            """
-            The return value of holidays may have overlapping date, for example:
-            2016-05-05    Ascension Thursday
-            2016-05-05        Liberation Day
-
-            Then, we only keep the first holiday
-            """
-            visited = set()
-            output = []
-
-            for a, b in input_tuples:
-                if not a in visited:
-                    visited.add(a)
-                    output.append((a, b))
-
-            return output
-
-        def get_holiday_factor(holiday: Optional[str]):
-            """
-            get factor from holidays.
-            """
-            if isnull(holiday):
-                return 1
-
-            if holiday in self._special_holiday_factors:
-                return self._special_holiday_factors[holiday]
-
-            return self._holiday_factor
-
-        def get_country_holiday_df(country_name: str):
-            """
-            Get all holiday days by give country in MAX_HISTORY_YEARS
-            """
-            # get all workalendar modules
-            workalendar_country_modules: List[str] = [
-                modname
-                for importer, modname, ispkg in pkgutil.walk_packages(
-                    workalendar.__path__, prefix=f"{workalendar.__name__}."
-                )
-                if not ispkg and modname.count(".") == 2
-            ]
-            workalendar_country_module = list(
-                filter(
-                    lambda work_cal: country_name.lower()
-                    in work_cal,  # module names are lowercase
-                    workalendar_country_modules,
-                )
+        start_date = Timestamp(start_date)
+        end_date = None if end_date is None else Timestamp(end_date)
+        first_year = start_date.year
+        last_year = start_date.year if end_date is None else end_date.year
+
+        # full years of days, from which the requested dates are selected after smoothing
+        dates: DatetimeIndex = self.get_datetime_index(
+            start_date=Timestamp(first_year, 1, 1),
+            end_date=Timestamp(last_year, 12, 31),
+        )
+        start_idx = dates.searchsorted(start_date)
+        end_idx = len(dates) if end_date is None else dates.searchsorted(end_date)
+        selected_dates: DatetimeIndex = dates[start_idx:end_idx]
+
+        countries: List[str] = list(self._features[iter(self._features).__next__()])
+        # a row of smoothed factors per country, from which a single DataFrame is built
+        country_factors: ndarray = empty((len(countries), len(selected_dates)))
+        for i, country_name in enumerate(countries):
+            smoothed: ndarray = self._get_smoothed_factors(
+                country_name, first_year, last_year
             )
-            if len(workalendar_country_module) != 1:
-                raise ValueError(
-                    f'country_name: "{country_name}" not recognized in workalendar modules:'
-                    f"{workalendar_country_modules}"
-                )
-            # Dynamically import the right class
-            module_parts = workalendar_country_module[0].split(".")
-            cal = getattr(
-                getattr(getattr(workalendar, module_parts[1]), module_parts[2]),
-                country_name,
-            )()
-
-            df = DataFrame()
-            for year in range(
-                start_date.year, end_date.year + 1
-            ):  # plus one to include the end_date year itself
-                holidays_tuples = clean_holiday_tuples(cal.holidays(int(year)))
-
-                # TODO: make this more efficient, loop over tuple once
-                datetime_l = [elem[0] for elem in holidays_tuples]
-                holiday_l = [elem[1] for elem in holidays_tuples]
-
-                # create series and fill NA for non-holiday date
-                holiday_series = Series(holiday_l, index=datetime_l)
-
-                # set full year index datetime
-                ix = date_range(
-                    start=date(int(year), 1, 1), end=date(int(year), 12, 31), freq="D"
-                )
-                holiday_series = holiday_series.reindex(ix)
+            country_factors[i] = smoothed[start_idx:end_idx]
+
+        return DataFrame(
+            {
+                self._date_col_name: tile(selected_dates, len(countries)),
+                "country": repeat(array(countries, dtype=object), len(selected_dates)),
+                self._col_name: country_factors.ravel(),
+            }
+        )
 
-                country_holiday_df = holiday_series.to_frame()
 
-                # add country column
-                country_holiday_df["country"] = country_name
+@lru_cache(maxsize=None)
+def _get_workalendar_classes() -> Dict[str, type]:
+    """
+    Get the workalendar calendar classes exported by the continent packages, by their lowercase class name. The
+    continent packages are only inspected once.
+    """
+    # workalendar is only imported when generating, as it imports all of its calendars
+    from workalendar.core import Calendar
+
+    calendar_classes: Dict[str, type] = {}
+    for continent in WORKALENDAR_CONTINENTS:
+        continent_module = import_module(f"workalendar.{continent}")
+        for name in dir(continent_module):
+            cls = getattr(continent_module, name)
+            if isinstance(cls, type) and issubclass(cls, Calendar):
+                calendar_classes.setdefault(name.lower(), cls)
+    return calendar_classes
+
+
+@lru_cache(maxsize=None)
+def _get_calendar(country_name: str) -> "Calendar":
+    """
+    Get the workalendar calendar of a country, by its case-insensitive class name. The calendar is cached, so it is
+    shared by all holiday factors.
+    """
+    calendar_classes: Dict[str, type] = _get_workalendar_classes()
+    if country_name.lower() not in calendar_classes:
+        raise ValueError(
+            f'country_name: "{country_name}" not recognized in workalendar calendars:'
+            f"{sorted(cls.__name__ for cls in calendar_classes.values())}"
+        )
+    return calendar_classes[country_name.lower()]()
 
-                country_holiday_df = country_holiday_df.reset_index()
-                country_holiday_df.columns = [self._date_col_name, "holiday", "country"]
 
-                # get factor
-                country_holiday_df[self._col_name] = country_holiday_df[
-                    "holiday"
-                ].apply(get_holiday_factor)
+def _get_year_holidays(cal: "Calendar", year: int) -> Tuple[ndarray, List[str]]:
+    """
+    Get the holidays of a year as days since epoch, and their names.
 
-                df = concat([df, country_holiday_df], ignore_index=True)
+    The holidays of a calendar may have overlapping dates, for example:
+    2016-05-05    Ascension Thursday
+    2016-05-05        Liberation Day
 
+    Then, we only keep the first holiday
 
-            # Apply smoothing to the curve using a gaussian moving window
-            df[self._col_name] = (
-                df[self._col_name]
-                .rolling(10, win_type="gaussian", min_periods=1)
-                .mean(std=2)
-            )
+    Calendars may also return observed holidays of the adjacent years, e.g. the observed new year's day of the next year
+    on december 31st. These are left out, the calendar of the adjacent year contains them as well.
+    """
+    holidays: Dict[date, str] = {}
+    for day, name in cal.holidays(year):
+        if day.year == year:
+            holidays.setdefault(day, name)
 
-            return df
+    epoch_days: ndarray = array(list(holidays), dtype="datetime64[D]").astype(int32)
+    return epoch_days, list(holidays.values())
 
-        holiday_df = concat(
-            map(get_country_holiday_df, self._features[iter(self._features).__next__()])
-        )
-        holiday_df = holiday_df.drop(axis=1, columns="holiday")
-
-        if end_date is None:
-            df_sel = holiday_df[(holiday_df[self._date_col_name] >= start_date)]
-        else:
-            df_sel = holiday_df[
-                (holiday_df[self._date_col_name] >= start_date)
-                & (holiday_df[self._date_col_name] < end_date)
-            ]
-
-            # reindex to rangelist
-        return df_sel.reset_index().drop(axis=1, columns="index")
+
+def _epoch_day(day: date) -> int:
+    """
+    Get the number of days since epoch of a date.
+    """
+    return int(datetime64(day, "D").astype(int32))
+
+
+def _gaussian_rolling_mean(values: ndarray, window: int, std: float) -> ndarray:
+    """
+    Trailing moving average weighted by a gaussian window, as `rolling(window, win_type="gaussian",
+    min_periods=1).mean(std=std)` of a Series without missing values, computed with two convolutions.
+
+    Args:
+        values: values to smooth.
+        window: number of values in the window.
+        std: standard deviation of the gaussian window.
+
+    Returns:
+        smoothed values. The first values are averaged over the part of the window that is available.
+    """
+    positions: ndarray = arange(window) - (window - 1) / 2
+    weights: ndarray = exp(-0.5 * (positions / std) ** 2)
+    weighted_sums: ndarray = convolve(values, weights)[: len(values)]
+    weight_sums: ndarray = convolve(ones(len(values)), weights)[: len(values)]
+    return weighted_sums / weight_sums
@@ -1,11 +1,11 @@
 from typing import Optional, Dict, Union
 
-from numpy.ma import arange
-from pandas import DataFrame
+from numpy import arange, array, empty, float64, fromiter, ndarray, tile
+from pandas import DataFrame, DatetimeIndex
 from pandas._libs.tslibs.timestamps import Timestamp
 
+from timeseries_generator._kernels import linear_trend
 from timeseries_generator.base_factor import BaseFactor
-from timeseries_generator.utils import get_cartesian_product
 
 
 class LinearTrend(BaseFactor):
@@ -118,46 +118,54 @@ class LinearTrend(BaseFactor):
         end_date: Optional[Union[Timestamp, str, int, float]] = None,
     ) -> DataFrame:
 
-        dr: DataFrame = self.get_datetime_index(
+        date_index: DatetimeIndex = self.get_datetime_index(
             start_date=start_date, end_date=end_date
-        ).to_frame(index=False, name=self._date_col_name)
-
-        start_date_ts: Timestamp = dr.iloc[0][self._date_col_name]
+        )
+        # Only working in days, the dates are consecutive days from the start date
+        days: ndarray = arange(len(date_index), dtype=float64)
 
+        # y = ax + b
+        # the coef is the total slope across the whole time period
+        # in order to calculate the daily delta, we need to divide the length of the date
         if self._feature_values:
+            labels = list(self._feature_values.keys())
+            coefs: ndarray = fromiter(
+                (value["coef"] for value in self._feature_values.values()),
+                dtype=float64,
+                count=len(labels),
+            )
+            offsets: ndarray = fromiter(
+                (value["offset"] for value in self._feature_values.values()),
+                dtype=float64,
+                count=len(labels),
+            )
+            # a row per date and a column per label, filled in place by the kernel
+            factors: ndarray = linear_trend(
+                days,
+                coefs,
+                offsets,
+                len(date_index),
+                empty((len(days), len(labels)), dtype=float64),
+            )
 
-            def get_factor_col(row) -> float:
-                days: float = float(
-                    getattr(row[self._date_col_name] - start_date_ts, "days")
-                )  # Only working in days
-                # y = ax + b
-                # the coef is the total slope across the whole time period
-                # in order to calculate the daily delta, we need to divide the length of the date
-                return row["coef"] / len(dr) * days + 1 + row["offset"]
-
-            df: DataFrame = DataFrame(
+            factor_df: DataFrame = DataFrame(
                 {
-                    self._feature: self._feature_values.keys(),
-                    "coef": map(
-                        lambda feat: feat["coef"], self._feature_values.values()
-                    ),
-                    "offset": map(
-                        lambda feat: feat["offset"], self._feature_values.values()
-                    ),
+                    self._date_col_name: date_index.repeat(len(labels)),
+                    self._feature: tile(labels, len(date_index)),
+                    self._col_name: factors.ravel(),
                 }
             )
 
-            factor_df: DataFrame = get_cartesian_product(dr, df)
-            factor_df[self._col_name] = factor_df.apply(get_factor_col, axis=1)
-            factor_df = factor_df.drop(["coef", "offset"], axis=1)
-
         else:
-            # y = ax + b
-            df: DataFrame = DataFrame(
-                (self._coef / len(dr) * arange(start=0, stop=len(dr)) + 1)
-                + self._offset,
-                columns=[self._col_name],
+            factors: ndarray = linear_trend(
+                days,
+                array([self._coef], dtype=float64),
+                array([self._offset], dtype=float64),
+                len(date_index),
+                empty((len(days), 1), dtype=float64),
+            )
+            factor_df: DataFrame = DataFrame(
+                {self._date_col_name: date_index, self._col_name: factors[:, 0]}
             )
-            factor_df: DataFrame = dr.join(df)
 
         return factor_df
@@ -5,10 +5,11 @@ from pandas import DataFrame
 from pandas._libs.tslibs.timestamps import Timestamp
 
 from timeseries_generator import BaseFactor
-from timeseries_generator.utils import get_cartesian_product
 
 
 class RandomFeatureFactor(BaseFactor):
+    time_invariant = True
+
     def __init__(
         self,
         feature: str,
@@ -16,9 +17,11 @@ class RandomFeatureFactor(BaseFactor):
         min_factor_value: float = 1.0,
         max_factor_value: float = 10.0,
         col_name: str = "random_feature_factor",
+        seed: Optional[int] = None,
     ):
         """
-        Creates a random factor for every feature value.
+        Creates a random factor for every feature value. The factors do not change over time, so the generated
+        DataFrame contains a row per feature value, without a date column.
 
         Args:
             feature: feature name.
@@ -26,6 +29,8 @@ class RandomFeatureFactor(BaseFactor):
             min_factor_value: minimum factor value.
             max_factor_value: maximum factor value.
             col_name:
+            seed: seed of the random number generator, to generate the same factors on every run. The global
+                `np.random.seed` does not affect this factor.
 
         Examples:
             Create a factor for every store in our store list: "store_1", "store_2"
@@ -46,6 +51,7 @@ class RandomFeatureFactor(BaseFactor):
             )
         self._min_factor_value = min_factor_value
         self._max_factor_value = max_factor_value
+        self._rng: np.random.Generator = np.random.default_rng(seed)
 
     def generate(
         self,
@@ -53,21 +59,14 @@ class RandomFeatureFactor(BaseFactor):
         end_date: Optional[Union[Timestamp, str, int, float]] = None,
     ) -> DataFrame:
 
-        dr: DataFrame = self.get_datetime_index(
-            start_date=start_date, end_date=end_date
-        ).to_frame(index=False, name=self._date_col_name)
-
         # randomly generate factor
-        # rand_value = min + ((max - min) * value)
-        feat_factor = self._min_factor_value + (
-            (self._max_factor_value - self._min_factor_value)
-            * np.random.random(len(self._feature_values))
+        feat_factor: np.ndarray = self._rng.uniform(
+            self._min_factor_value,
+            self._max_factor_value,
+            size=len(self._feature_values),
         )
 
-        # generate factor df
-        factor_df = DataFrame(
+        # the factors are the same for every date
+        return DataFrame(
             {self._feature: self._feature_values, self._col_name: feat_factor}
         )
-
-        # cartesian product of factor df and datetime df
-        return get_cartesian_product(dr, factor_df)
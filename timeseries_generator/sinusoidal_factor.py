@@ -1,12 +1,11 @@
-from math import pi
 from typing import Optional, Dict, Union
 
-from numpy import sin, arange
-from pandas import DataFrame
+from numpy import array, empty, float32, float64, fromiter, ndarray, tile
+from pandas import DataFrame, DatetimeIndex
 from pandas._libs.tslibs.timestamps import Timestamp
 
+from timeseries_generator._kernels import NS_PER_DAY, sinusoid
 from timeseries_generator.base_factor import BaseFactor
-from timeseries_generator.utils import get_cartesian_product
 
 VARIABLES = ["wavelength", "amplitude", "phase", "mean"]
 
@@ -141,53 +140,53 @@ class SinusoidalFactor(BaseFactor):
         start_date: Union[Timestamp, str, int, float],
         end_date: Optional[Union[Timestamp, str, int, float]] = None,
     ) -> DataFrame:
-        dr: DataFrame = self.get_datetime_index(
+        date_index: DatetimeIndex = self.get_datetime_index(
             start_date=start_date, end_date=end_date
-        ).to_frame(index=False, name=self._date_col_name)
-
-        start_date_ts: Timestamp = dr.iloc[0][self._date_col_name]
+        )
+        # Only working in days, counted from the start date
+        t: ndarray = ((date_index.asi8 - date_index.asi8[0]) // NS_PER_DAY).astype(
+            float32
+        )
 
+        # y(t) A * sin(2 * pi * freq * t + phase) + mean
         if self._feature_values:
-
-            def get_factor_col(row) -> float:
-                t: float = float(
-                    getattr(row[self._date_col_name] - start_date_ts, "days")
-                )  # Only working in days
-                # y(t) A * sin(2 * pi * freq * t + phase) + mean
-                return (
-                    row["amplitude"]
-                    * sin(2 * pi * (t + row["phase"]) / row["wavelength"])
-                    + row["mean"]
-                )
-
-            df: DataFrame = DataFrame(
-                dict(
-                    {self._feature: list(self._feature_values.keys())},
-                    **{
-                        var: list(
-                            map(lambda feat: feat[1][var], self._feature_values.items())
-                        )
-                        for var in VARIABLES
-                    },
+            labels = list(self._feature_values.keys())
+            wavelength, amplitude, phase, mean = (
+                fromiter(
+                    (values[var] for values in self._feature_values.values()),
+                    dtype=float64,
+                    count=len(labels),
                 )
+                for var in VARIABLES
+            )
+            # a column of factor values per label, filled in place by the kernel
+            factors: ndarray = sinusoid(
+                t,
+                wavelength,
+                amplitude,
+                phase,
+                mean,
+                empty((len(t), len(labels)), dtype=float32),
             )
 
-            factor_df: DataFrame = get_cartesian_product(dr, df)
-            factor_df[self._col_name] = factor_df.apply(get_factor_col, axis=1)
-            factor_df = factor_df.drop(VARIABLES, axis=1)
+            factor_df: DataFrame = DataFrame(
+                {
+                    self._date_col_name: date_index.repeat(len(labels)),
+                    self._feature: tile(labels, len(t)),
+                    self._col_name: factors.ravel(),
+                }
+            )
         else:
-            # y(t) A * sin(2 * pi * freq * t + phase) + mean
-            df: DataFrame = DataFrame(
-                self._amplitude
-                * sin(
-                    2
-                    * pi
-                    * (arange(start=0, stop=len(dr)) + self._phase)
-                    / self._wavelength
-                )
-                + self._mean,
-                columns=[self._col_name],
+            factors: ndarray = sinusoid(
+                t,
+                array([self._wavelength], dtype=float64),
+                array([self._amplitude], dtype=float64),
+                array([self._phase], dtype=float64),
+                array([self._mean], dtype=float64),
+                empty((len(t), 1), dtype=float32),
+            )
+            factor_df: DataFrame = DataFrame(
+                {self._date_col_name: date_index, self._col_name: factors[:, 0]}
             )
-            factor_df: DataFrame = dr.join(df)
 
         return factor_df
@@ -1,3 +1,4 @@
+from numpy import arange, repeat, tile
 from pandas import DataFrame
 
 
@@ -12,5 +13,15 @@ def get_cartesian_product(df1: DataFrame, df2: DataFrame) -> DataFrame:
         DataFrame containing the cartesian product of both dataframes
 
     """
-    df = df1.assign(key=1).merge(df2.assign(key=1), on="key").drop("key", axis=1)
+    n1, n2 = len(df1), len(df2)
+    # every row of df1 is combined with all rows of df2, so the columns are built by replicating row positions instead
+    # of joining on a dummy key. Taking from the column arrays keeps their dtypes.
+    idx1 = repeat(arange(n1), n2)
+    idx2 = tile(arange(n2), n1)
+    df = DataFrame(
+        {
+            **{col: df1[col].array.take(idx1) for col in df1.columns},
+            **{col: df2[col].array.take(idx2) for col in df2.columns},
+        }
+    )
     return df
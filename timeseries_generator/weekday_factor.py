@@ -1,8 +1,10 @@
 from typing import Optional, Dict, Union
 
-from pandas import DataFrame
+from numpy import array, empty, float64, ndarray
+from pandas import DataFrame, DatetimeIndex
 from pandas._libs.tslibs.timestamps import Timestamp
 
+from timeseries_generator._kernels import weekday_lookup
 from timeseries_generator.base_factor import BaseFactor
 
 
@@ -34,42 +36,86 @@ class WeekdayFactor(BaseFactor):
         intensity_scale: int = 1,
     ):
 
+        if factor_values is not None and not isinstance(factor_values, dict):
+            raise ValueError(f"WeekdayFactor factor_values should be a dictionary")
+
         if factor_values is None:
             # default is a weekend factor
             factor_values = {4: 1.15, 5: 1.3, 6: 1.3}
 
-        if type(factor_values) is not dict:
-            raise ValueError(f"WeekdayFactor factor_values should be a dictionary")
-
         self._factor_values = factor_values
         self._intensity_scale = intensity_scale
+        # factor per day of the week, so that the factors of all dates are looked up at once
+        self._weekday_factors: ndarray = self._get_weekday_factors()
 
         super().__init__(col_name=col_name)
 
+    @property
+    def factor_values(self):
+        return self._factor_values
+
+    @factor_values.setter
+    def factor_values(self, factor_values: Dict[int, float]):
+        self._factor_values = factor_values
+        self._weekday_factors = self._get_weekday_factors()
+
+    @property
+    def intensity_scale(self):
+        return self._intensity_scale
+
+    @intensity_scale.setter
+    def intensity_scale(self, intensity_scale: int):
+        self._intensity_scale = intensity_scale
+        self._weekday_factors = self._get_weekday_factors()
+
+    def _get_weekday_factors(self) -> ndarray:
+        """
+        Gets the factors of the days of the week.
+
+        Returns:
+            array with the factor of every day of the week, indexed by the day number.
+        """
+        weekday_factors: ndarray = array(
+            [self._factor_values.get(day_number, 1) for day_number in range(7)],
+            dtype=float64,
+        )
+        # the intensity is applied to the table, so generating the factors is only a lookup
+        if self._intensity_scale != 1:
+            weekday_factors *= self._intensity_scale
+        return weekday_factors
+
     def generate(
         self,
         start_date: Union[Timestamp, str, int, float],
         end_date: Union[Timestamp, str, int, float] = None,
     ) -> DataFrame:
-        df: DataFrame = self.get_datetime_index(
-            start_date=start_date, end_date=end_date
-        ).to_frame(index=False, name=self._date_col_name)
+        # the dates are parsed once, instead of by both the date range and the search of the end date
+        start_date = Timestamp(start_date)
+        if end_date is not None:
+            end_date = Timestamp(end_date)
 
-        df["weekday"] = df[self._date_col_name].dt.dayofweek
-        df[self._col_name] = df["weekday"].apply(
-            lambda day_number: self._factor_values.get(day_number, 1)
-            * self._intensity_scale
+        date_index: DatetimeIndex = self.get_datetime_index(
+            start_date=start_date, end_date=end_date
         )
+        if end_date is not None:
+            # the end date is excluded
+            date_index = date_index[: date_index.searchsorted(end_date)]
 
-        df = df.drop(axis=1, columns="weekday")
-
-        if end_date is None:
-            df_sel = df[(df[self._date_col_name] >= start_date)]
-        else:
-            df_sel = df[
-                (df[self._date_col_name] >= start_date)
-                & (df[self._date_col_name] < end_date)
-            ]
+        # timezone aware dates get the day of the week in their timezone
+        local_dates: DatetimeIndex = (
+            date_index if date_index.tz is None else date_index.tz_localize(None)
+        )
+        factors: ndarray = weekday_lookup(
+            local_dates.asi8,
+            self._weekday_factors,
+            empty(len(date_index), dtype=float64),
+        )
 
-        # reindex to rangelist
-        return df_sel.reset_index().drop(axis=1, columns="index")
+        # only the cached dates are copied, see `_cached_date_range`
+        return DataFrame(
+            {
+                self._date_col_name: date_index.array.copy(),
+                self._col_name: factors,
+            },
+            copy=False,
+        )
@@ -1,14 +1,14 @@
-import itertools
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 
-from numpy.random.mtrand import randn
-from pandas import DataFrame
+from numpy import add, dtype as np_dtype, empty, float32, multiply, ndarray, tile
+from numpy.random import default_rng
+from numpy.typing import DTypeLike
+from pandas import DataFrame, DatetimeIndex, MultiIndex
 from pandas._libs.tslibs.timestamps import Timestamp
 
 from timeseries_generator.base_factor import BaseFactor
 from timeseries_generator.utils import get_cartesian_product
 
-
 FeatureValues = Dict[str, Dict[str, float]]
 
 
@@ -18,6 +18,8 @@ class WhiteNoise(BaseFactor):
         stdev_factor: float = 0.05,
         feature_values: Optional[FeatureValues] = None,
         col_name: str = "white_noise",
+        seed: Optional[int] = None,
+        dtype: DTypeLike = float32,
     ):
         """
         Add white noise to the timeseries. The noise component will have a bell-shaped distribution, based on the input
@@ -29,6 +31,9 @@ class WhiteNoise(BaseFactor):
             feature_values: dictionary with the feature name as key and a dictionaty as value. This dictionaty contains
                 the feature values as keys and the stdev_factors as values.
             col_name: name of the factor column.
+            seed: seed of the random number generator, to generate the same noise on every run. The global
+                `np.random.seed` does not affect this factor.
+            dtype: floating point type of the factor column, float32 or float64.
 
         Raises:
             AttributeError when stdev_factor and feature_values are set, or when more then one feature gets a unique
@@ -65,6 +70,8 @@ class WhiteNoise(BaseFactor):
         )
         self._stdev_factor = stdev_factor
         self._feature_values = feature_values
+        self._rng = default_rng(seed)
+        self._dtype: np_dtype = np_dtype(dtype)
 
     @property
     def stdev_factor(self):
@@ -86,41 +93,64 @@ class WhiteNoise(BaseFactor):
             )
         self._feature_values = feature_values
 
+    def _noise(self, stdev_factor: Union[float, ndarray], size: int) -> ndarray:
+        """
+        Draws noise factors around 1, in the floating point type of the factor.
+
+        Args:
+            stdev_factor: standard deviation of the noise, or an array with a standard deviation per factor.
+            size: number of factors to draw.
+
+        Returns:
+            array containing the noise factors.
+        """
+        # the noise is drawn into a single array, which is scaled and shifted in place
+        noise: ndarray = empty(size, dtype=self._dtype)
+        self._rng.standard_normal(dtype=self._dtype, out=noise)
+        multiply(noise, stdev_factor, out=noise)
+        add(noise, 1, out=noise)
+        return noise
+
     def generate(self, start_date: Timestamp, end_date: Timestamp = None) -> DataFrame:
-        dr: DataFrame = self.get_datetime_index(
+        date_index: DatetimeIndex = self.get_datetime_index(
             start_date=start_date, end_date=end_date
-        ).to_frame(index=False, name=self._date_col_name)
+        )
 
         if self._features:
-            # Using self.features here gets all the features from the generator
-            df: DataFrame = DataFrame(
-                itertools.product(*self._features.values()),
-                columns=list(self._features.keys()),
-            )
+            dr: DataFrame = date_index.to_frame(index=False, name=self._date_col_name)
+            # Using self.features here gets all the features from the generator. The combinations of the feature values
+            # are built from their codes, instead of a tuple per combination
+            df: DataFrame = MultiIndex.from_product(
+                list(self._features.values()), names=list(self._features.keys())
+            ).to_frame(index=False)
             factor_df = get_cartesian_product(dr, df)
             if self._feature_values:
                 feature: str = iter(
                     self._feature_values
                 ).__next__()  # len(self._features is always 1)
-                factor_df["noise_1"] = randn(len(factor_df))
-
-                def get_factor_col(row):
-                    stdev_factor: float = self._feature_values[feature][row[feature]]
-                    return stdev_factor * row["noise1"] + 1
-
-                factor_df[self._col_name] = factor_df.apply(
-                    get_factor_col, axis=1
-                ).drop("noise1", axis=1)
+                # standard deviation of every combination of feature values. The cartesian product repeats the
+                # combinations for every date, so the standard deviations are repeated instead of mapped per row
+                stdev_factors: ndarray = tile(
+                    df[feature]
+                    .map(self._feature_values[feature])
+                    .to_numpy(dtype=self._dtype),
+                    len(dr),
+                )
+                factor_df[self._col_name] = self._noise(stdev_factors, len(factor_df))
             else:
-                factor_df[self._col_name] = (
-                    self._stdev_factor * randn(len(factor_df)) + 1
+                factor_df[self._col_name] = self._noise(
+                    self._stdev_factor, len(factor_df)
                 )
 
         else:
-            # self._features can be none if used outside of generator
-            df: DataFrame = DataFrame(
-                self._stdev_factor * randn(len(dr)) + 1, columns=[self._col_name]
+            # self._features can be none if used outside of generator. Only the cached dates are copied, see
+            # `_cached_date_range`
+            factor_df = DataFrame(
+                {
+                    self._date_col_name: date_index.array.copy(),
+                    self._col_name: self._noise(self._stdev_factor, len(date_index)),
+                },
+                copy=False,
             )
-            factor_df = dr.join(df)
 
         return factor_df
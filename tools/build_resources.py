@@ -0,0 +1,61 @@
+"""
+Converts the public data CSV files in `timeseries_generator/resources/public_data` to the Parquet files that are read
+by the external factors. Parquet files are stored with an explicit schema, so loading them skips CSV parsing and type
+inference.
+
+Run this script from the root of the repository after updating one of the CSV files:
+    python tools/build_resources.py
+"""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import read_csv, to_datetime
+
+PUBLIC_DATA_DIR = (
+    Path(__file__).parent.parent / "timeseries_generator" / "resources" / "public_data"
+)
+
+
+def build_gdp_per_capita():
+    df = read_csv(
+        PUBLIC_DATA_DIR / "GDP_per_capita_countries.csv", encoding="utf-8-sig"
+    )
+    # the first 4 columns contain the country and indicator labels, the others contain the GDPPC per year
+    label_cols, year_cols = list(df.columns[:4]), list(df.columns[4:])
+    df[year_cols] = df[year_cols].astype("float32")
+
+    schema = pa.schema(
+        [pa.field(col, pa.string()) for col in label_cols]
+        + [pa.field(col, pa.float32()) for col in year_cols]
+    )
+    pq.write_table(
+        pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+        PUBLIC_DATA_DIR / "GDP_per_capita_countries.parquet",
+    )
+
+
+def build_eu_prod_index():
+    df = read_csv(
+        PUBLIC_DATA_DIR / "eu_prod_index.csv", names=["date", "value", "is_estimated"]
+    )
+    df["date"] = to_datetime(df["date"], format="%Y-%m").dt.date
+    df["value"] = df["value"].astype("float32")
+
+    schema = pa.schema(
+        [
+            pa.field("date", pa.date32()),
+            pa.field("value", pa.float32()),
+            pa.field("is_estimated", pa.string()),
+        ]
+    )
+    pq.write_table(
+        pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+        PUBLIC_DATA_DIR / "eu_prod_index.parquet",
+    )
+
+
+if __name__ == "__main__":
+    build_gdp_per_capita()
+    build_eu_prod_index()